@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+from numba import njit
+from scipy.spatial.distance import cdist
 
 __author__ = "Jason Lines"
 
@@ -24,71 +26,72 @@ def ed(x, y):
     return np.power(x - y, 2).sum()
 
 
+@njit(cache=True)
+def _dtw_banded(x, y, window_size):
+    """Compute the dtw distance between two series within a Sakoe-Chiba band.
+
+    Only two rows of the warping matrix are kept in memory and only the cells
+    inside the band are visited, so the cost is O(n * window_size). Cells
+    outside of the band are inf, so fastmath (which assumes finite values) is
+    not used.
+    """
+    n = x.shape[0]
+    m = y.shape[0]
+    prev = np.full(m, np.inf)
+    curr = np.full(m, np.inf)
+
+    # initialise the top row of the warping matrix
+    curr[0] = (x[0] - y[0]) ** 2
+    for j in range(1, min(window_size, m)):
+        curr[j] = (x[0] - y[j]) ** 2 + curr[j - 1]
+
+    for i in range(1, n):
+        prev, curr = curr, prev
+        # first column of the warping matrix
+        if i < window_size:
+            curr[0] = (x[i] - y[0]) ** 2 + prev[0]
+        else:
+            curr[0] = np.inf
+        # the recycled row still holds values from two rows back; the only
+        # stale cell read below is the left neighbour of the first banded cell
+        lo = max(1, i - window_size)
+        if lo > 1:
+            curr[lo - 1] = np.inf
+
+        # visit all allowed cells, calculate the value as the distance in this
+        # cell + min(top, left, or top-left)
+        cutoff_beaten = False
+        for j in range(lo, min(m - 1, i + window_size) + 1):
+            curr[j] = (x[i] - y[j]) ** 2 + min(prev[j], curr[j - 1], prev[j - 1])
+            if curr[j] < np.inf:
+                cutoff_beaten = True
+
+        # at least one value on this row must be finite, otherwise the final
+        # distance is guaranteed to be inf, so early-abandon
+        if not cutoff_beaten:
+            return np.inf
+
+    return curr[m - 1]
+
+
 def dtw_distance(first, second, **kwargs):
     def dtw_single_channel(first, second, **kwargs):
-        cutoff = np.inf
         try:
             window = kwargs["window"]
         except Exception:
             window = 1.0
+        first = np.asarray(first, dtype=np.float64)
+        second = np.asarray(second, dtype=np.float64)
         n = len(first)
         m = len(second)
 
-        warp_matrix = np.full([n, m], np.inf)
         if n > m:
             window_size = n * window
         else:
             window_size = m * window
         window_size = int(window_size)
 
-        def dist(x1, x2):
-            return (x1 - x2) ** 2
-
-        pairwise_distances = np.asarray(
-            [[dist(x1, x2) for x2 in second] for x1 in first]
-        )
-
-        # initialise edges of the warping matrix
-        warp_matrix[0][0] = pairwise_distances[0][0]
-        for i in range(1, window_size):
-            warp_matrix[0][i] = pairwise_distances[0][i] + warp_matrix[0][i - 1]
-            warp_matrix[i][0] = pairwise_distances[i][0] + warp_matrix[i - 1][0]
-
-        # now visit all allowed cells, calculate the value as the distance
-        # in this cell + min(top, left, or top-left)
-        # traverse each row,
-        for row in range(1, n):
-            cutoff_beaten = False
-            # traverse left and right by the allowed window
-            for column in range(row - window_size, row + 1 + window_size):
-                if column < 1 or column >= m:
-                    continue
-
-                # find smallest entry in the warping matrix, either above,
-                # to the left, or diagonally left and up
-                above = warp_matrix[row - 1][column]
-                left = warp_matrix[row][column - 1]
-                diag = warp_matrix[row - 1][column - 1]
-
-                # add the pairwise distance for [row][column] to the minimum
-                # of the three possible potential cells
-                warp_matrix[row][column] = pairwise_distances[row][column] + min(
-                    [above, left, diag]
-                )
-
-                # check for evidence that cutoff has been beaten on this row
-                # (if using)
-                if cutoff is not None and warp_matrix[row][column] < cutoff:
-                    cutoff_beaten = True
-
-            # if using a cutoff, at least one calculated value on this row
-            # MUST be less than the cutoff otherwise the
-            # final distance is guaranteed not to be less. Therefore,
-            # if the cutoff has not been beaten, early-abandon
-            if cutoff is not None and cutoff_beaten is False:
-                return float("inf")
-
-        return warp_matrix[n - 1][m - 1]
+        return _dtw_banded(first, second, window_size)
 
     if isinstance(first, np.ndarray) and isinstance(first[0], float) is True:
         return dtw_single_channel(first, second, **kwargs)
@@ -124,11 +127,11 @@ def weighted_dtw_distance(first, second, **kwargs):
 
         weight_vector = [1 / (1 + np.exp(-g * (i - m / 2))) for i in range(0, m)]
 
-        def dist(x1, x2):
-            return (x1 - x2) ** 2
-
-        pairwise_distances = np.asarray(
-            [[dist(x1, x2) for x2 in second] for x1 in first]
+        # squared differences between all pairs of points, computed in one call
+        pairwise_distances = cdist(
+            np.asarray(first, dtype=np.float64).reshape(-1, 1),
+            np.asarray(second, dtype=np.float64).reshape(-1, 1),
+            metric="sqeuclidean",
         )
 
         # initialise edges of the warping matrix
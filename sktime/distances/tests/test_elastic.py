@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.distances.elastic import dtw_distance
+
+
+def _naive_dtw(x, y, window_size):
+    """Full-matrix dtw with the same band as dtw_distance, for reference."""
+    n, m = len(x), len(y)
+    warp = np.full((n, m), np.inf)
+    warp[0, 0] = (x[0] - y[0]) ** 2
+    for i in range(1, min(window_size, m)):
+        warp[0, i] = (x[0] - y[i]) ** 2 + warp[0, i - 1]
+    for i in range(1, min(window_size, n)):
+        warp[i, 0] = (x[i] - y[0]) ** 2 + warp[i - 1, 0]
+    for i in range(1, n):
+        for j in range(max(1, i - window_size), min(m - 1, i + window_size) + 1):
+            warp[i, j] = (x[i] - y[j]) ** 2 + min(
+                warp[i - 1, j], warp[i, j - 1], warp[i - 1, j - 1]
+            )
+    return warp[n - 1, m - 1]
+
+
+@pytest.mark.parametrize("window", [0.0, 0.1, 0.25, 0.5, 1.0])
+@pytest.mark.parametrize("n_timepoints", [2, 10, 25])
+def test_dtw_distance_against_naive(window, n_timepoints):
+    """Test dtw_distance against a full-matrix dtw for equal length series."""
+    rng = np.random.RandomState(42)
+    x = rng.normal(size=n_timepoints)
+    y = rng.normal(size=n_timepoints)
+    expected = _naive_dtw(x, y, int(n_timepoints * window))
+    np.testing.assert_almost_equal(dtw_distance(x, y, window=window), expected)
+
+
+@pytest.mark.parametrize(
+    "x, y, expected",
+    [
+        ([0.0, 1.0, 2.0], [0.0, 2.0], 1.0),
+        ([0.0, 1.0, 2.0, 3.0], [0.0, 3.0], 2.0),
+        ([0.0, 3.0], [0.0, 1.0, 2.0, 3.0], 2.0),
+    ],
+)
+def test_dtw_distance_unequal_length(x, y, expected):
+    """Test dtw_distance on unequal length series with the default window."""
+    assert dtw_distance(np.array(x), np.array(y)) == expected
+
+
+def test_dtw_distance_multichannel():
+    """Test that multichannel dtw is the sum over channels."""
+    rng = np.random.RandomState(42)
+    x = rng.normal(size=(3, 20))
+    y = rng.normal(size=(3, 20))
+    expected = sum(dtw_distance(x[dim], y[dim], window=0.2) for dim in range(3))
+    np.testing.assert_almost_equal(dtw_distance(x, y, window=0.2), expected)
+
+
+def test_dtw_distance_series_input():
+    """Test that channels passed as pd.Series give the same distance."""
+    rng = np.random.RandomState(42)
+    x = rng.normal(size=20)
+    y = rng.normal(size=20)
+    np.testing.assert_almost_equal(
+        dtw_distance([pd.Series(x)], [pd.Series(y)]), dtw_distance(x, y)
+    )
@@ -38,7 +38,9 @@ class OnlineEnsembleForecaster(EnsembleForecaster):
         self.n_jobs = n_jobs
         self.ensemble_algorithm = ensemble_algorithm
 
-        super(EnsembleForecaster, self).__init__(forecasters=forecasters, n_jobs=n_jobs)
+        super(OnlineEnsembleForecaster, self).__init__(
+            forecasters=forecasters, n_jobs=n_jobs
+        )
 
     def _fit(self, y, X=None, fh=None):
         """Fit to training data.